@@ -18,8 +18,10 @@ from .pipeline import build_weight_profile, run_wamecu_cycle
 from .simulate import (
     BetaDriftConfig,
     beta_drift,
+    simulate_counts,
     simulate_draws,
     simulate_time_varying_draws,
+    spawn_generators,
     stream_draws,
 )
 
@@ -27,8 +29,9 @@ from .simulate_static import (
     StaticSimulationResult,
     estimate_static_effect,
     simulate_with_static,
+    simulate_with_static_batch,
 )
-from .utils import wamecu_probabilities
+from .utils import wamecu_probabilities, wamecu_probabilities_batch
 
 __all__ = [
     "AdaptiveBetaEstimator",
@@ -47,11 +50,15 @@ __all__ = [
     "run_wamecu_cycle",
     "shannon_entropy",
     "simulate_beta_drift",
+    "simulate_counts",
     "simulate_draws",
     "simulate_time_varying_draws",
+    "spawn_generators",
     "stream_draws",
     "StaticSimulationResult",
     "estimate_static_effect",
     "simulate_with_static",
+    "simulate_with_static_batch",
     "wamecu_probabilities",
+    "wamecu_probabilities_batch",
 ]
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+from scipy.special import chdtrc
 
-from .metrics import chi_square_test, shannon_entropy
+from .metrics import _shannon_entropy, chi_square_test
+from .utils import _as_array
 
 
 def chi_square_statistic(
@@ -27,27 +31,97 @@ def entropy_gap(
     baseline_prob = np.asarray(baseline_prob, dtype=float)
     if empirical_prob.shape != baseline_prob.shape:
         raise ValueError("probability vectors must have matching shape")
+    if empirical_prob.ndim != 1:
+        raise ValueError("probabilities must be one-dimensional")
     if not np.isclose(empirical_prob.sum(), 1.0):
         raise ValueError("empirical_prob must sum to 1")
     if not np.isclose(baseline_prob.sum(), 1.0):
         raise ValueError("baseline_prob must sum to 1")
+    if np.any(empirical_prob < 0) or np.any(baseline_prob < 0):
+        raise ValueError("probabilities must be non-negative")
 
-    entropy_empirical = shannon_entropy(empirical_prob)
-    entropy_baseline = shannon_entropy(baseline_prob)
-    return float(entropy_empirical - entropy_baseline)
+    return _shannon_entropy(empirical_prob) - _shannon_entropy(baseline_prob)
+
+
+@lru_cache(maxsize=32)
+def _c_log2_c_table(window_size: int) -> np.ndarray:
+    """Return a cached, read-only lookup of ``c * log2(c)`` for ``c <= W``."""
+
+    occupancy = np.arange(window_size + 1, dtype=float)
+    table = occupancy * np.log2(
+        occupancy, out=np.zeros_like(occupancy), where=occupancy > 0
+    )
+    table.setflags(write=False)
+    return table
+
+
+def _sliding_bin_counts(
+    draws: np.ndarray,
+    window_size: int,
+    n_outcomes: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-step bin counts seen by the sliding-window DEC/INC updates.
+
+    For every step ``t >= window_size`` the first array holds the count of
+    ``draws[t - window_size]`` in the window before it leaves, and the second
+    the count of ``draws[t]`` once the leaving draw is gone but before it
+    enters.  Occurrences are located through one stable sort keyed by
+    ``(outcome, position)``, so memory stays ``O(len(draws))``.
+    """
+
+    n = draws.size
+    # The (outcome, position) keys fit in int32 for all but very long, wide
+    # streams; narrower indices halve the bandwidth of the sort and searches.
+    index_dtype = np.int32 if n * n_outcomes < np.iinfo(np.int32).max else np.int64
+    order = np.argsort(draws, kind="stable").astype(index_dtype)
+    keys = draws[order].astype(index_dtype) * n + order
+    starts = np.searchsorted(keys, np.arange(n_outcomes, dtype=index_dtype) * n)
+    starts = starts.astype(index_dtype)
+
+    # rank[s] counts occurrences of draws[s] at positions <= s.
+    rank = np.empty(n, dtype=index_dtype)
+    rank[order] = np.arange(n, dtype=index_dtype) - starts[draws[order]] + 1
+
+    def occurrences_up_to(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        key = values.astype(index_dtype) * n + positions
+        return np.searchsorted(keys, key, side="right") - starts[values]
+
+    steps = np.arange(window_size, n, dtype=index_dtype)
+    leaving = draws[:-window_size]
+    entering = draws[window_size:]
+    leaving_counts = occurrences_up_to(leaving, steps - 1) - (rank[:-window_size] - 1)
+    entering_counts = (rank[window_size:] - 1) - occurrences_up_to(
+        entering, steps - window_size
+    )
+    return leaving_counts, entering_counts
 
 
 def rolling_anomaly_scores(
-    draws: Iterable[int],
+    draws: npt.ArrayLike | Iterable[int],
     baseline_probabilities: np.ndarray,
     window_size: int,
+    min_expected_count: float = 4.0,
 ) -> pd.DataFrame:
-    """Compute rolling chi-square and entropy diagnostics."""
-
-    draws = np.asarray(list(draws), dtype=int)
+    """Compute rolling chi-square and entropy diagnostics.
+
+    When at least two, but not all, outcomes have an expected count per
+    window below ``min_expected_count``, those sparse outcomes are pooled
+    into a single bin for the chi-square test, where the asymptotic
+    distribution is unreliable for sparse cells.  A lone sparse outcome, or
+    a baseline where every outcome is sparse, is left unpooled, and the
+    pooled bin itself may still fall below ``min_expected_count``.  The
+    entropy gap is always computed over the original outcomes.  The pooled
+    outcome indices (``[]`` when nothing was pooled) are recorded in
+    ``attrs["pooled_outcomes"]`` of the returned frame; pass
+    ``min_expected_count=0`` to disable pooling.
+    """
+
+    draws = _as_array(draws, int)
     baseline_probabilities = np.asarray(baseline_probabilities, dtype=float)
     if draws.ndim != 1:
         raise ValueError("draws must be one-dimensional")
+    if baseline_probabilities.ndim != 1:
+        raise ValueError("baseline_probabilities must be one-dimensional")
     if np.any(baseline_probabilities < 0) or not np.isclose(
         baseline_probabilities.sum(), 1.0
     ):
@@ -58,43 +132,120 @@ def rolling_anomaly_scores(
     n_outcomes = baseline_probabilities.size
     if draws.size < window_size:
         raise ValueError("draws must contain at least one full window")
+    if draws.min() < 0 or draws.max() >= n_outcomes:
+        raise ValueError("draws must index the baseline outcomes")
 
-    records: list[dict[str, float]] = []
     expected_counts = baseline_probabilities * window_size
-
-    for end in range(window_size, draws.size + 1):
-        window = draws[slice(end - window_size, end)]
-        counts = np.bincount(window, minlength=n_outcomes)
-        stat, p_value = chi_square_statistic(counts, expected_counts)
-        empirical = counts / window_size
-        ent_gap = entropy_gap(empirical, baseline_probabilities)
-        records.append(
-            {
-                "step": end - 1,
-                "chi2_stat": stat,
-                "chi2_pvalue": p_value,
-                "entropy_gap": ent_gap,
-            }
+    if np.any(expected_counts <= 0):
+        raise ValueError("expected counts must be positive")
+
+    # Sliding-window INC/DEC recurrence (Chen & Ng, 2014): each step removes
+    # ``draws[t - window_size]`` and adds ``draws[t]``, so only those two bins
+    # change.  Writing chi-square as ``sum(c_i**2 / E_i) - W`` and entropy as
+    # ``log2(W) - sum(c_i * log2(c_i)) / W`` turns every window into an O(1)
+    # update of the previous one, independent of the number of outcomes.
+    leaving_counts, entering_counts = _sliding_bin_counts(
+        draws, window_size, n_outcomes
+    )
+
+    # Pool sparse outcomes once, up front, so every window is tested on the
+    # same reduced set of bins.
+    small = expected_counts < min_expected_count
+    pooled_outcomes = np.flatnonzero(small)
+    if 1 < pooled_outcomes.size < n_outcomes:
+        outcome_map = np.cumsum(~small) - 1
+        outcome_map[small] = np.count_nonzero(~small)
+        chi2_draws = outcome_map[draws]
+        chi2_expected = np.bincount(outcome_map, weights=expected_counts)
+        chi2_leaving_counts, chi2_entering_counts = _sliding_bin_counts(
+            chi2_draws, window_size, chi2_expected.size
         )
-
-    return pd.DataFrame.from_records(records)
+    else:
+        pooled_outcomes = pooled_outcomes[:0]
+        chi2_draws, chi2_expected = draws, expected_counts
+        chi2_leaving_counts, chi2_entering_counts = leaving_counts, entering_counts
+
+    # One preallocated buffer per output column, filled in place and handed to
+    # pandas without a further copy.
+    n_windows = draws.size - window_size + 1
+    steps = np.arange(window_size - 1, draws.size)
+    stats = np.empty(n_windows, dtype=float)
+    p_values = np.empty(n_windows, dtype=float)
+    entropy_gaps = np.empty(n_windows, dtype=float)
+
+    # DEC: leaving bin goes c -> c - 1; INC: entering bin goes c -> c + 1.
+    inv_expected = 1.0 / chi2_expected
+    initial_counts = np.bincount(chi2_draws[:window_size], minlength=chi2_expected.size)
+    stats[0] = np.sum(initial_counts**2 * inv_expected) - window_size
+    np.cumsum(
+        (1 - 2 * chi2_leaving_counts) * inv_expected[chi2_draws[:-window_size]]
+        + (2 * chi2_entering_counts + 1) * inv_expected[chi2_draws[window_size:]],
+        out=stats[1:],
+    )
+    stats[1:] += stats[0]
+    np.maximum(stats, 0.0, out=stats)
+    chdtrc(chi2_expected.size - 1, stats, out=p_values)
+
+    # entropy_gap = log2(W) - sum(c log2 c) / W - H(baseline)
+    c_log_c = _c_log2_c_table(window_size)
+    initial_counts = np.bincount(draws[:window_size], minlength=n_outcomes)
+    entropy_gaps[0] = c_log_c[initial_counts].sum()
+    np.cumsum(
+        c_log_c[leaving_counts - 1]
+        - c_log_c[leaving_counts]
+        + c_log_c[entering_counts + 1]
+        - c_log_c[entering_counts],
+        out=entropy_gaps[1:],
+    )
+    entropy_gaps[1:] += entropy_gaps[0]
+    entropy_gaps /= -window_size
+    entropy_gaps += np.log2(window_size) - _shannon_entropy(baseline_probabilities)
+
+    scores = pd.DataFrame(
+        {
+            "step": steps,
+            "chi2_stat": stats,
+            "chi2_pvalue": p_values,
+            "entropy_gap": entropy_gaps,
+        },
+        copy=False,
+    )
+    scores.attrs["pooled_outcomes"] = pooled_outcomes.tolist()
+    return scores
 
 
 def outcome_correlation_matrix(
-    draws: Iterable[int],
+    draws: npt.ArrayLike | Iterable[int],
     n_outcomes: int,
 ) -> np.ndarray:
-    """Return the Pearson correlation matrix of one-hot encoded draws."""
+    """Return the Pearson correlation matrix of one-hot encoded draws.
+
+    For one-hot indicators the covariance has the closed form
+    ``cov[i, j] = p_i * (delta_ij - p_j)`` with ``p`` the empirical outcome
+    frequencies, so the matrix is assembled from a single ``bincount``
+    without materialising the ``(n_draws, n_outcomes)`` indicator array.
+    Outcomes that never (or always) occur have zero variance and receive
+    zero correlation.
+    """
 
-    draws = np.asarray(list(draws), dtype=int)
+    draws = _as_array(draws, int)
     if draws.ndim != 1:
         raise ValueError("draws must be one-dimensional")
     if n_outcomes <= 1:
         raise ValueError("n_outcomes must be greater than 1")
     if draws.size == 0:
         raise ValueError("draws cannot be empty")
-
-    one_hot = np.eye(n_outcomes)[draws]
-    correlation = np.corrcoef(one_hot, rowvar=False)
-    correlation = np.nan_to_num(correlation)
+    if draws.min() < 0 or draws.max() >= n_outcomes:
+        raise ValueError("draws must index the available outcomes")
+
+    frequencies = np.bincount(draws, minlength=n_outcomes) / draws.size
+    correlation = np.outer(-frequencies, frequencies)
+    correlation[np.diag_indices(n_outcomes)] += frequencies
+
+    # Normalise the covariance in place by 1 / (std_i * std_j); zero-variance
+    # outcomes get a zero scale instead of producing NaNs to clean up later.
+    std = np.sqrt(frequencies * (1.0 - frequencies))
+    inv_std = np.divide(1.0, std, out=np.zeros_like(std), where=std > 0)
+    correlation *= inv_std[:, np.newaxis]
+    correlation *= inv_std[np.newaxis, :]
     return correlation
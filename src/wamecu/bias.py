@@ -5,10 +5,13 @@ from __future__ import annotations
 from typing import Iterable
 
 import numpy as np
+import numpy.typing as npt
+
+from .utils import _as_array
 
 
 def inverse_mass_probabilities(
-    weights: Iterable[float], softness: float = 1.0
+    weights: npt.ArrayLike | Iterable[float], softness: float = 1.0
 ) -> np.ndarray:
     """Convert outcome weights into a probability distribution.
 
@@ -17,7 +20,7 @@ def inverse_mass_probabilities(
     quickly probability mass decreases with weight.
     """
 
-    weights = np.asarray(list(weights), dtype=float)
+    weights = _as_array(weights, float)
     if weights.ndim != 1:
         raise ValueError("weights must be one-dimensional")
     if np.any(weights <= 0):
@@ -27,15 +30,22 @@ def inverse_mass_probabilities(
     if softness <= 0:
         raise ValueError("softness must be positive")
 
-    inverse_mass = 1.0 / np.power(weights, softness)
+    # Elementwise pow() is the slow path; the default softness needs only a
+    # reciprocal, squares are a multiply, and anything else is exp(-s log w).
+    if softness == 1.0:
+        inverse_mass = 1.0 / weights
+    elif softness == 2.0:
+        inverse_mass = 1.0 / np.square(weights)
+    else:
+        inverse_mass = np.exp(-softness * np.log(weights))
     probabilities = inverse_mass / inverse_mass.sum()
     return probabilities
 
 
-def probabilities_to_beta(probabilities: Iterable[float]) -> np.ndarray:
+def probabilities_to_beta(probabilities: npt.ArrayLike | Iterable[float]) -> np.ndarray:
     """Map probabilities back to :math:`\beta` coefficients under WAMECU."""
 
-    probabilities = np.asarray(list(probabilities), dtype=float)
+    probabilities = _as_array(probabilities, float)
     if probabilities.ndim != 1:
         raise ValueError("probabilities must be one-dimensional")
     if probabilities.size == 0:
@@ -46,7 +56,11 @@ def probabilities_to_beta(probabilities: Iterable[float]) -> np.ndarray:
     if not np.isclose(total, 1.0):
         raise ValueError("probabilities must sum to 1")
 
-    n_outcomes = probabilities.size
-    baseline = 1.0 / n_outcomes
-    beta = probabilities / baseline - 1.0
-    return beta
+    return _probabilities_to_beta(probabilities)
+
+
+def _probabilities_to_beta(probabilities: np.ndarray) -> np.ndarray:
+    """Invert the WAMECU law for a probability vector that is already valid."""
+
+    baseline = 1.0 / probabilities.size
+    return probabilities / baseline - 1.0
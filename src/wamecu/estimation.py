@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Iterable
 
 import numpy as np
+import numpy.typing as npt
+from scipy import signal
 
-from .utils import wamecu_probabilities
-from .simulate import BetaDriftConfig, beta_drift
+from .utils import _as_array
+from .simulate import BetaDriftConfig, SeedLike, beta_drift
 
 
 def simulate_beta_drift(
@@ -17,7 +19,7 @@ def simulate_beta_drift(
     drift: str = "random_walk",
     scale: float = 0.05,
     clip: float = 0.8,
-    seed: int | None = None,
+    seed: SeedLike = None,
 ) -> np.ndarray:
     """Legacy helper that delegates to :func:`wamecu.simulate.beta_drift`."""
 
@@ -46,7 +48,7 @@ class EWMAState:
 
 
 def ewma_estimator(
-    observations: Sequence[int],
+    observations: npt.ArrayLike | Iterable[int],
     n_outcomes: int,
     alpha: float = 0.05,
     initial_probabilities: Iterable[float] | None = None,
@@ -58,39 +60,68 @@ def ewma_estimator(
     if not 0 < alpha <= 1:
         raise ValueError("alpha must be in (0, 1]")
 
-    obs_array = np.asarray(list(observations), dtype=int)
-    if obs_array.ndim != 1:
-        raise ValueError("observations must be 1D")
+    obs_array = _validated_observations(observations, n_outcomes)
 
     if initial_probabilities is None:
         probabilities = np.full(n_outcomes, 1.0 / n_outcomes, dtype=float)
     else:
-        probabilities = np.asarray(list(initial_probabilities), dtype=float)
+        probabilities = _as_array(initial_probabilities, float)
         if probabilities.size != n_outcomes:
             raise ValueError("initial_probabilities length mismatch")
         probabilities = probabilities / probabilities.sum()
 
-    beta_history = np.zeros((obs_array.size, n_outcomes), dtype=float)
-    baseline = 1.0 / n_outcomes
+    history = _ewma_probabilities(obs_array, alpha, probabilities)
+    return _centered_beta(history)
 
-    for t, obs in enumerate(obs_array):
-        if not 0 <= obs < n_outcomes:
-            raise ValueError("observation index out of bounds")
-        one_hot = np.zeros(n_outcomes, dtype=float)
-        one_hot[obs] = 1.0
-        probabilities = (1 - alpha) * probabilities + alpha * one_hot
-        probabilities = np.maximum(probabilities, 1e-12)
-        probabilities /= probabilities.sum()
-        beta = probabilities / baseline - 1.0
-        beta -= beta.mean()
-        beta = np.clip(beta, -0.99, 0.99)
-        beta_history[t] = beta
 
-    return beta_history
+def _validated_observations(
+    observations: npt.ArrayLike | Iterable[int], n_outcomes: int
+) -> np.ndarray:
+    """Return observations as a 1D integer array of valid outcome indices."""
+
+    obs_array = _as_array(observations, int)
+    if obs_array.ndim != 1:
+        raise ValueError("observations must be 1D")
+    if obs_array.size and (obs_array.min() < 0 or obs_array.max() >= n_outcomes):
+        raise ValueError("observation index out of bounds")
+    return obs_array
+
+
+def _ewma_probabilities(
+    observations: np.ndarray,
+    alpha: float,
+    probabilities: np.ndarray,
+) -> np.ndarray:
+    """Return the smoothed probability history for validated observations.
+
+    ``P_t = (1 - alpha) P_{t-1} + alpha e_t`` is a first-order IIR filter
+    applied independently to every outcome column of the one-hot
+    observations, seeded with ``probabilities`` through the filter state.
+    """
+
+    one_hot = np.zeros((observations.size, probabilities.size))
+    one_hot[np.arange(observations.size), observations] = 1.0
+    initial_state = ((1 - alpha) * probabilities)[np.newaxis, :]
+    history, _ = signal.lfilter(
+        [alpha], [1.0, -(1 - alpha)], one_hot, axis=0, zi=initial_state
+    )
+    np.maximum(history, 1e-12, out=history)
+    history /= history.sum(axis=1, keepdims=True)
+    return history
+
+
+def _centered_beta(probabilities: np.ndarray) -> np.ndarray:
+    """Map probabilities (last axis = outcomes) to centred, clipped β."""
+
+    baseline = 1.0 / probabilities.shape[-1]
+    beta = probabilities / baseline - 1.0
+    beta -= beta.mean(axis=-1, keepdims=True)
+    np.clip(beta, -0.99, 0.99, out=beta)
+    return beta
 
 
 def kalman_tracker(
-    observations: Sequence[int],
+    observations: npt.ArrayLike | Iterable[int],
     n_outcomes: int,
     process_var: float = 0.005,
     observation_var: float = 0.05,
@@ -103,39 +134,55 @@ def kalman_tracker(
     if process_var <= 0 or observation_var <= 0:
         raise ValueError("variances must be positive")
 
-    obs_array = np.asarray(list(observations), dtype=int)
-    if obs_array.ndim != 1:
-        raise ValueError("observations must be 1D")
+    obs_array = _validated_observations(observations, n_outcomes)
 
     if initial_beta is None:
         state = np.zeros(n_outcomes, dtype=float)
     else:
-        state = np.asarray(list(initial_beta), dtype=float)
+        state = _as_array(initial_beta, float)
         if state.size != n_outcomes:
             raise ValueError("initial_beta must match n_outcomes")
         state = np.clip(state, -0.99, 0.99)
 
-    covariance = np.full(n_outcomes, 0.25, dtype=float)
-    beta_history = np.zeros((obs_array.size, n_outcomes), dtype=float)
-    baseline = 1.0 / n_outcomes
-
-    for t, obs in enumerate(obs_array):
-        if not 0 <= obs < n_outcomes:
-            raise ValueError("observation index out of bounds")
-
-        measurement = np.full(n_outcomes, -baseline, dtype=float)
-        measurement[obs] = 1.0 - baseline
+    # The covariance recursion never looks at the observations and starts
+    # from the same value for every outcome, so the gain is one scalar per
+    # step that can be computed ahead of the state updates.
+    gains = np.empty(obs_array.size, dtype=float)
+    covariance = 0.25
+    for t in range(obs_array.size):
+        covariance += process_var
+        gains[t] = covariance / (covariance + observation_var)
+        covariance *= 1 - gains[t]
 
-        covariance = covariance + process_var
-        kalman_gain = covariance / (covariance + observation_var)
-        state = state + kalman_gain * (measurement - state)
-        covariance = (1 - kalman_gain) * covariance
+    beta_history = np.zeros((obs_array.size, n_outcomes), dtype=float)
+    _kalman_loop(obs_array, gains, 1.0 / n_outcomes, state, beta_history)
+    return beta_history
 
-        state -= state.mean()
-        state = np.clip(state, -0.99, 0.99)
-        beta_history[t] = state
 
-    return beta_history
+def _kalman_loop(
+    observations: np.ndarray,
+    gains: np.ndarray,
+    baseline: float,
+    state: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Advance the Kalman state in place, writing each step into ``out``.
+
+    The measurement for observation ``k`` is ``e_k - baseline``, so the update
+    ``state += g * (measurement - state)`` only needs a scale, a shift and a
+    single scatter per step.  Inputs are assumed to be validated.
+    """
+
+    n_outcomes = state.size
+    for t, obs in enumerate(observations):
+        gain = gains[t]
+        state *= 1 - gain
+        state -= gain * baseline
+        state[obs] += gain
+        state -= state.sum() / n_outcomes
+        np.minimum(state, 0.99, out=state)
+        np.maximum(state, -0.99, out=state)
+        out[t] = state
 
 
 class AdaptiveBetaEstimator:
@@ -152,27 +199,28 @@ class AdaptiveBetaEstimator:
         self.beta_ = np.zeros(n_outcomes, dtype=float)
 
     def update(self, observation: int) -> np.ndarray:
-        history = ewma_estimator(
-            [observation],
-            self.n_outcomes,
-            alpha=self.smoothing,
-            initial_probabilities=self._probabilities,
-        )
-        self._probabilities = (1 - self.smoothing) * self._probabilities
-        self._probabilities[observation] += self.smoothing
-        self._probabilities /= self._probabilities.sum()
-        self.beta_ = history[-1]
+        if not 0 <= observation < self.n_outcomes:
+            raise ValueError("observation index out of bounds")
+        probabilities = self._probabilities
+        probabilities *= 1 - self.smoothing
+        probabilities[observation] += self.smoothing
+        np.maximum(probabilities, 1e-12, out=probabilities)
+        probabilities /= probabilities.sum()
+        self.beta_ = _centered_beta(probabilities)
         return self.beta_.copy()
 
-    def batch_update(self, observations: Iterable[int]) -> np.ndarray:
-        history = ewma_estimator(
-            observations,
-            self.n_outcomes,
-            alpha=self.smoothing,
-            initial_probabilities=self._probabilities,
+    def batch_update(self, observations: npt.ArrayLike | Iterable[int]) -> np.ndarray:
+        obs_array = _validated_observations(observations, self.n_outcomes)
+        if obs_array.size == 0:
+            return np.zeros((0, self.n_outcomes), dtype=float)
+        probabilities = _ewma_probabilities(
+            obs_array, self.smoothing, self._probabilities
         )
-        self.beta_ = history[-1]
-        self._probabilities = wamecu_probabilities(self.n_outcomes, self.beta_)
+        history = _centered_beta(probabilities)
+        # Carry the filter state itself forward rather than rebuilding it from
+        # the centred and clipped β.
+        self._probabilities = probabilities[-1].copy()
+        self.beta_ = history[-1].copy()
         return history
 
 
@@ -8,14 +8,14 @@ import numpy as np
 import pandas as pd
 
 from .anomaly import outcome_correlation_matrix, rolling_anomaly_scores
-from .bias import inverse_mass_probabilities, probabilities_to_beta
+from .bias import _probabilities_to_beta, inverse_mass_probabilities
 from .estimation import AdaptiveBetaEstimator
 from .simulate import (
     BetaDriftConfig,
     beta_drift,
     simulate_time_varying_draws,
 )
-from .utils import wamecu_probabilities
+from .utils import _as_array, wamecu_probabilities_batch
 
 
 def build_weight_profile(
@@ -55,7 +55,7 @@ def run_wamecu_cycle(
         weights = build_weight_profile(n_outcomes)
         rng.shuffle(weights)
     else:
-        weights = np.asarray(list(weight_profile), dtype=float)
+        weights = _as_array(weight_profile, float)
         if weights.size != n_outcomes:
             raise ValueError("weight_profile size must match n_outcomes")
 
@@ -63,7 +63,8 @@ def run_wamecu_cycle(
         weights,
         softness=softness,
     )
-    baseline_beta = probabilities_to_beta(baseline_probabilities)
+    # inverse_mass_probabilities already returns a validated distribution.
+    baseline_beta = _probabilities_to_beta(baseline_probabilities)
 
     sin_amplitude = 0.0 if drift != "sinusoidal" else drift_scale * 2
 
@@ -86,9 +87,7 @@ def run_wamecu_cycle(
             safety / (safety - min_adjusted), 0.5
         )
 
-    probabilities = np.vstack(
-        [wamecu_probabilities(n_outcomes, beta) for beta in beta_series]
-    )
+    probabilities = wamecu_probabilities_batch(n_outcomes, beta_series)
     draws = simulate_time_varying_draws(
         beta_series, seed=None if seed is None else seed + 2
     )
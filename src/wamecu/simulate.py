@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, Union
 
 import numpy as np
 
-from .utils import wamecu_probabilities
+from .utils import _as_array, wamecu_probabilities_batch
+
+SeedLike = Union[int, np.random.Generator, None]
 
 
 @dataclass
@@ -30,7 +32,8 @@ class BetaDriftConfig:
     clip:
         Maximum absolute value for :math:`\beta` to keep probabilities valid.
     seed:
-        Optional random seed for reproducibility.
+        Optional random seed, or an existing :class:`numpy.random.Generator`
+        to draw from, for reproducibility.
     """
 
     n_steps: int
@@ -39,7 +42,7 @@ class BetaDriftConfig:
     sin_amplitude: float = 0.08
     sin_period: int = 120
     clip: float = 0.95
-    seed: int | None = 7
+    seed: SeedLike = 7
 
 
 def beta_drift(config: BetaDriftConfig) -> np.ndarray:
@@ -59,30 +62,65 @@ def beta_drift(config: BetaDriftConfig) -> np.ndarray:
         raise ValueError("clip must be between 0 and 1")
 
     rng = np.random.default_rng(config.seed)
-    betas = np.zeros((config.n_steps, config.n_outcomes), dtype=float)
-    current = np.zeros(config.n_outcomes, dtype=float)
-
     phase = rng.uniform(0, 2 * np.pi)
-    for t in range(config.n_steps):
-        noise = rng.normal(0.0, config.walk_scale, size=config.n_outcomes)
-        current += noise
-        current -= current.mean()
+    noise = rng.normal(0.0, config.walk_scale, size=(config.n_steps, config.n_outcomes))
+    sinusoid = np.zeros(config.n_steps, dtype=float)
+    if config.sin_period > 0 and config.sin_amplitude != 0:
+        steps = np.arange(config.n_steps, dtype=float)
+        sinusoid = config.sin_amplitude * np.sin(
+            2 * np.pi * steps / config.sin_period + phase
+        )
+
+    # While the clip is inactive the recursion is linear: the centred state is
+    # the running sum of centred noise plus the centred sinusoid kick on the
+    # first outcome, and the newest kick adds ``sinusoid[t] / n_outcomes`` to
+    # every outcome before the next step centres it away.
+    kick = (sinusoid / config.n_outcomes)[:, np.newaxis]
+    increments = noise - noise.mean(axis=1, keepdims=True)
+    increments -= kick
+    increments[:, 0] += sinusoid
+    betas = np.cumsum(increments, axis=0, out=increments)
+    betas += kick
+
+    # The closed form is exact up to the first step where the clip binds;
+    # only the remainder has to be replayed sequentially.
+    clipped = np.flatnonzero((np.abs(betas) > config.clip).any(axis=1))
+    if clipped.size == 0:
+        return betas
+
+    start = clipped[0]
+    current = betas[start - 1].copy() if start else np.zeros(config.n_outcomes)
+    _drift_loop(noise[start:], sinusoid[start:], config.clip, current, betas[start:])
+    return betas
 
-        if config.sin_period > 0 and config.sin_amplitude != 0:
-            sinusoid = config.sin_amplitude * np.sin(
-                2 * np.pi * t / config.sin_period + phase
-            )
-            current[0] += sinusoid
 
-        current = np.clip(current, -config.clip, config.clip)
-        betas[t] = current
+def _drift_loop(
+    noise: np.ndarray,
+    sinusoid: np.ndarray,
+    clip: float,
+    current: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Replay the clipped drift recursion in place over pre-drawn inputs.
 
-    return betas
+    Each step adds ``noise[t]``, re-centres, kicks the first outcome by
+    ``sinusoid[t]`` and clips ``current`` in place before writing it to
+    ``out[t]``; no temporaries are allocated per step.
+    """
+
+    n_outcomes = current.size
+    for t in range(noise.shape[0]):
+        current += noise[t]
+        current -= current.sum() / n_outcomes
+        current[0] += sinusoid[t]
+        np.minimum(current, clip, out=current)
+        np.maximum(current, -clip, out=current)
+        out[t] = current
 
 
 def stream_draws(
     beta_series: Sequence[Sequence[float]],
-    seed: int | None = None,
+    seed: SeedLike = None,
 ) -> np.ndarray:
     """Simulate streaming categorical draws for each :math:`\beta_t`."""
 
@@ -91,52 +129,105 @@ def stream_draws(
         raise ValueError("beta_series must be 2D with shape (steps, outcomes)")
 
     n_steps, n_outcomes = beta_array.shape
-    draws = np.empty(n_steps, dtype=int)
+    probabilities = wamecu_probabilities_batch(n_outcomes, beta_array)
     rng = np.random.default_rng(seed)
 
-    for t in range(n_steps):
-        probs = wamecu_probabilities(n_outcomes, beta_array[t])
-        draws[t] = rng.choice(n_outcomes, p=probs)
-
+    # Same inverse-CDF rule as ``rng.choice(n_outcomes, p=probs)`` (one uniform
+    # per step, right-sided search in the normalised CDF), evaluated for every
+    # step at once so seeded streams are unchanged.
+    cdf = np.cumsum(probabilities, axis=1, out=probabilities)
+    cdf /= cdf[:, -1:]
+    uniforms = rng.random(n_steps)
+    draws = np.count_nonzero(cdf <= uniforms[:, np.newaxis], axis=1)
     return draws
 
 
 def simulate_draws(
     probabilities: Iterable[float],
     n_trials: int,
-    seed: int | None = None,
+    seed: SeedLike = None,
 ) -> np.ndarray:
     """Simulate i.i.d. draws from a fixed probability vector."""
 
-    probs = np.asarray(list(probabilities), dtype=float)
+    probs = _normalised_probabilities(probabilities, n_trials)
+    rng = np.random.default_rng(seed)
+    return rng.choice(probs.size, size=n_trials, p=probs)
+
+
+def simulate_counts(
+    probabilities: Iterable[float],
+    n_trials: int,
+    seed: SeedLike = None,
+) -> np.ndarray:
+    """Simulate per-outcome counts of ``n_trials`` i.i.d. draws.
+
+    Equivalent in distribution to
+    ``np.bincount(simulate_draws(...), minlength=len(probabilities))`` but
+    sampled directly from the multinomial, so memory is O(n_outcomes) rather
+    than O(n_trials). The random stream differs from :func:`simulate_draws`.
+    """
+
+    probs = _normalised_probabilities(probabilities, n_trials)
+    rng = np.random.default_rng(seed)
+    return rng.multinomial(n_trials, probs)
+
+
+def _normalised_probabilities(
+    probabilities: Iterable[float], n_trials: int
+) -> np.ndarray:
+    """Validate the inputs shared by the fixed-vector samplers."""
+
+    probs = _as_array(probabilities, float)
     if probs.ndim != 1:
         raise ValueError("probabilities must be 1D")
-    if np.any(probs < 0):
+    if probs.size and probs.min() < 0.0:
         raise ValueError("probabilities must be non-negative")
-    total = probs.sum()
-    if not np.isclose(total, 1.0):
-        probs = probs / total
     if n_trials <= 0:
         raise ValueError("n_trials must be positive")
-
-    rng = np.random.default_rng(seed)
-    support = np.arange(probs.size)
-    return rng.choice(support, size=n_trials, p=probs)
+    return probs / probs.sum()
 
 
 def simulate_time_varying_draws(
     beta_series: Sequence[Sequence[float]],
-    seed: int | None = None,
+    seed: SeedLike = None,
 ) -> np.ndarray:
     """Backward compatible alias for :func:`stream_draws`."""
 
     return stream_draws(beta_series, seed=seed)
 
 
+def spawn_generators(seed: SeedLike, n_streams: int) -> list[np.random.Generator]:
+    """Fork ``n_streams`` independent generators from a single seed.
+
+    Stream ``k`` wraps ``bit_generator.jumped(k + 1)`` of the parent, i.e. the
+    parent state advanced by ``k + 1`` jumps, so the children effectively never
+    overlap with each other or with the parent. Bit generators without
+    ``jumped`` (e.g. SFC64) fall back to children spawned from the parent's
+    ``SeedSequence``. Pass each child as ``seed`` to the simulators (e.g. one
+    per worker in a parameter sweep) instead of re-seeding a fresh generator
+    per call.
+    """
+
+    if n_streams < 0:
+        raise ValueError("n_streams must be non-negative")
+
+    parent = np.random.default_rng(seed).bit_generator
+    if hasattr(parent, "jumped"):
+        return [np.random.Generator(parent.jumped(k + 1)) for k in range(n_streams)]
+
+    bit_generator_type = type(parent)
+    return [
+        np.random.Generator(bit_generator_type(child))
+        for child in parent.seed_seq.spawn(n_streams)
+    ]
+
+
 __all__ = [
     "BetaDriftConfig",
     "beta_drift",
+    "simulate_counts",
     "simulate_draws",
     "simulate_time_varying_draws",
+    "spawn_generators",
     "stream_draws",
 ]
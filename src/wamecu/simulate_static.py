@@ -9,11 +9,13 @@ for richer physics if they gather better evidence.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict
 
 import numpy as np
+import numpy.typing as npt
 
-from .utils import wamecu_probabilities
+from .simulate import SeedLike
+from .utils import _wamecu_probabilities, wamecu_probabilities_batch
 
 # Physical constants used in the Coulomb-inspired transformation.  The
 # parameters are exposed for documentation and easy tuning within notebooks.
@@ -57,7 +59,7 @@ class StaticSimulationResult:
         }
 
 
-def _humidity_scale(humidity: float) -> float:
+def _humidity_scale(humidity: float | np.ndarray) -> float | np.ndarray:
     """Map relative humidity to a damping multiplier.
 
     High humidity dissipates charge quickly, while dry air lets it accumulate.
@@ -66,10 +68,11 @@ def _humidity_scale(humidity: float) -> float:
         s(h) = clip(1 - h / 100, 0.1, 1.0)
 
     Researchers can replace this with an exponential decay or empirical fit if
-    laboratory data becomes available.
+    laboratory data becomes available.  Accepts a scalar or an array of
+    humidities (one per sweep configuration).
     """
 
-    return float(np.clip(1.0 - humidity / 100.0, 0.1, 1.0))
+    return np.clip(1.0 - humidity / 100.0, 0.1, 1.0)
 
 
 def simulate_with_static(
@@ -77,7 +80,7 @@ def simulate_with_static(
     q_scale: float = 1e-9,
     humidity: float = 40.0,
     trials_per_draw: int = 200,
-    seed: Optional[int] = None,
+    seed: SeedLike = None,
 ) -> Dict[str, np.ndarray]:
     """Simulate outcome bias caused by electrostatic charge accumulation.
 
@@ -108,7 +111,7 @@ def simulate_with_static(
         Keep small for notebook smoke tests; increase for precision studies.
     seed:
         Optional integer seed forwarded to :class:`numpy.random.Generator` for
-        reproducibility.
+        reproducibility, or an existing generator to draw from directly.
 
     Returns
     -------
@@ -134,20 +137,82 @@ def simulate_with_static(
 
     q = rng.normal(loc=0.0, scale=q_scale, size=n_outcomes) * humidity_factor
 
+    # F_i = k_e * q_i * (sum_j q_j - q_i) / d^2
     net_charge = np.sum(q)
-    force = K_COULOMB * q * (net_charge - q) / (PAIRWISE_DISTANCE_M**2)
-    beta_elec = np.clip(force * BETA_SCALE, -BETA_CLIP, BETA_CLIP)
-
-    beta_mech = rng.normal(loc=0.0, scale=MECHANICAL_BETA_SCALE, size=n_outcomes)
-    beta = np.clip(beta_elec + beta_mech, -BETA_CLIP, BETA_CLIP)
-
-    probs = wamecu_probabilities(n_outcomes, beta)
+    force = np.subtract(net_charge, q)
+    force *= q
+    force *= K_COULOMB / (PAIRWISE_DISTANCE_M**2)
+    force *= BETA_SCALE
+    beta_elec = np.clip(force, -BETA_CLIP, BETA_CLIP, out=force)
+
+    beta = rng.normal(loc=0.0, scale=MECHANICAL_BETA_SCALE, size=n_outcomes)
+    beta += beta_elec
+    np.clip(beta, -BETA_CLIP, BETA_CLIP, out=beta)
+
+    # ``beta`` is a fresh length-``n_outcomes`` float array here.
+    probs = _wamecu_probabilities(beta)
     counts = rng.multinomial(trials_per_draw, probs)
 
     result = StaticSimulationResult(q=q, beta=beta, probs=probs, counts=counts)
     return result.as_dict()
 
 
+def simulate_with_static_batch(
+    n_outcomes: int,
+    q_scale: npt.ArrayLike,
+    humidity: npt.ArrayLike,
+    trials_per_draw: int = 200,
+    seed: SeedLike = None,
+) -> Dict[str, np.ndarray]:
+    """Run :func:`simulate_with_static` for a whole sweep of configurations.
+
+    ``q_scale`` and ``humidity`` are broadcast against each other to one value
+    per configuration. Every modelling step of :func:`simulate_with_static` is
+    applied to all configurations at once, and the results are returned as
+    structure-of-arrays: each of ``q``, ``beta``, ``probs`` and ``counts`` is a
+    contiguous ``(n_configs, n_outcomes)`` array whose row ``i`` corresponds to
+    configuration ``i``.
+
+    The random numbers are drawn in bulk (all charges, then all mechanical
+    noise, then all counts), so row ``i`` does not reproduce a standalone
+    :func:`simulate_with_static` call with the same seed; the batch as a whole
+    is reproducible for a fixed ``seed``.
+    """
+
+    if n_outcomes < 2:
+        raise ValueError("n_outcomes must be at least 2")
+    if trials_per_draw <= 0:
+        raise ValueError("trials_per_draw must be positive")
+
+    q_scale, humidity = np.broadcast_arrays(
+        np.asarray(q_scale, dtype=float), np.asarray(humidity, dtype=float)
+    )
+    if q_scale.ndim != 1:
+        raise ValueError("q_scale and humidity must broadcast to a 1D sweep")
+
+    rng = np.random.default_rng(seed)
+    humidity_factor = _humidity_scale(humidity)
+
+    n_configs = q_scale.size
+    q = rng.normal(loc=0.0, scale=q_scale[:, np.newaxis], size=(n_configs, n_outcomes))
+    q *= humidity_factor[:, np.newaxis]
+
+    force = np.subtract(q.sum(axis=1, keepdims=True), q)
+    force *= q
+    force *= K_COULOMB / (PAIRWISE_DISTANCE_M**2) * BETA_SCALE
+    np.clip(force, -BETA_CLIP, BETA_CLIP, out=force)
+
+    beta = rng.normal(
+        loc=0.0, scale=MECHANICAL_BETA_SCALE, size=(n_configs, n_outcomes)
+    )
+    beta += force
+    np.clip(beta, -BETA_CLIP, BETA_CLIP, out=beta)
+
+    probs = wamecu_probabilities_batch(n_outcomes, beta)
+    counts = rng.multinomial(trials_per_draw, probs)
+    return {"q": q, "beta": beta, "probs": probs, "counts": counts}
+
+
 def estimate_static_effect(
     q: np.ndarray,
     counts: np.ndarray,
@@ -192,21 +257,25 @@ def estimate_static_effect(
 
     n = q.size
     baseline_p = 1.0 / n
-    observed_p = counts / float(trials)
-    observed_p = np.clip(observed_p, 1e-9, 1 - 1e-9)
+    observed_p = counts * (1.0 / trials)
+    np.clip(observed_p, 1e-9, 1 - 1e-9, out=observed_p)
 
-    logit = np.log(observed_p / (1.0 - observed_p))
+    # y = logit(p) - logit(1 / n)
     baseline_logit = np.log(baseline_p / (1.0 - baseline_p))
-    y = logit - baseline_logit
+    y = np.subtract(1.0, observed_p)
+    np.divide(observed_p, y, out=y)
+    np.log(y, out=y)
+    y -= baseline_logit
 
     q_centered = q - q.mean()
-    denom = np.sum(q_centered**2) + 1e-24
-    effect = float(np.sum(q_centered * y) / denom)
+    denom = q_centered @ q_centered + 1e-24
+    effect = float(q_centered @ y / denom)
     return effect
 
 
 __all__ = [
     "StaticSimulationResult",
     "simulate_with_static",
+    "simulate_with_static_batch",
     "estimate_static_effect",
 ]
@@ -5,17 +5,22 @@ from __future__ import annotations
 from .simulate import (
     BetaDriftConfig,
     beta_drift,
+    simulate_counts,
     simulate_draws,
     simulate_time_varying_draws,
+    spawn_generators,
     stream_draws,
 )
-from .utils import wamecu_probabilities
+from .utils import wamecu_probabilities, wamecu_probabilities_batch
 
 __all__ = [
     "BetaDriftConfig",
     "beta_drift",
+    "simulate_counts",
     "simulate_draws",
     "simulate_time_varying_draws",
+    "spawn_generators",
     "stream_draws",
     "wamecu_probabilities",
+    "wamecu_probabilities_batch",
 ]
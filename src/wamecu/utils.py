@@ -5,6 +5,21 @@ from __future__ import annotations
 from typing import Iterable
 
 import numpy as np
+import numpy.typing as npt
+
+
+def _as_array(values: npt.ArrayLike | Iterable, dtype: type) -> np.ndarray:
+    """Convert ``values`` to an array without an intermediate Python list.
+
+    Arrays and array-likes go through :func:`numpy.asarray`, which avoids a
+    copy when the dtype already matches; lists and tuples are converted
+    directly, and any other iterable (e.g. a generator) is streamed with
+    :func:`numpy.fromiter`.
+    """
+
+    if hasattr(values, "__array__") or isinstance(values, (list, tuple)):
+        return np.asarray(values, dtype=dtype)
+    return np.fromiter(values, dtype=dtype)
 
 
 def wamecu_probabilities(n_outcomes: int, beta: Iterable[float]) -> np.ndarray:
@@ -28,21 +43,70 @@ def wamecu_probabilities(n_outcomes: int, beta: Iterable[float]) -> np.ndarray:
         If ``beta`` length mismatches ``n_outcomes`` or produces negative mass.
     """
 
-    beta_array = np.asarray(list(beta), dtype=float)
+    beta_array = _as_array(beta, float)
     if beta_array.size != n_outcomes:
         raise ValueError("beta vector must match number of outcomes")
 
-    base = np.full(n_outcomes, 1.0 / n_outcomes, dtype=float)
-    adjusted = base * (1.0 + beta_array)
+    return _wamecu_probabilities(beta_array)
+
+
+def _wamecu_probabilities(beta: np.ndarray) -> np.ndarray:
+    """Array fast path of :func:`wamecu_probabilities`.
+
+    ``beta`` must already be a non-empty 1D float array; only the mass checks
+    are performed.
+    """
 
-    if np.any(adjusted < 0):
+    adjusted = beta + 1.0
+    adjusted *= 1.0 / beta.size
+
+    if adjusted.min() < 0.0:
         raise ValueError("bias coefficients yield negative probabilities")
 
     total = adjusted.sum()
     if total <= 0:
         raise ValueError("bias coefficients collapse the probability mass")
 
-    return adjusted / total
+    adjusted *= 1.0 / total
+    return adjusted
+
+
+def wamecu_probabilities_batch(n_outcomes: int, beta: np.ndarray) -> np.ndarray:
+    """Apply :func:`wamecu_probabilities` to every row of a β matrix at once.
+
+    Parameters
+    ----------
+    n_outcomes:
+        Number of distinct categorical outcomes.
+    beta:
+        Array of shape ``(n_steps, n_outcomes)`` holding one β vector per row.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(n_steps, n_outcomes)`` whose rows each sum to one.
+
+    Raises
+    ------
+    ValueError
+        If ``beta`` has the wrong shape or any row produces negative mass.
+    """
+
+    beta_array = np.asarray(beta, dtype=float)
+    if beta_array.ndim != 2 or beta_array.shape[1] != n_outcomes:
+        raise ValueError("beta matrix must have shape (n_steps, n_outcomes)")
+
+    adjusted = beta_array + 1.0
+    adjusted *= 1.0 / n_outcomes
+    if adjusted.size and adjusted.min() < 0.0:
+        raise ValueError("bias coefficients yield negative probabilities")
+
+    totals = adjusted.sum(axis=1, keepdims=True)
+    if totals.size and totals.min() <= 0.0:
+        raise ValueError("bias coefficients collapse the probability mass")
+
+    adjusted *= np.reciprocal(totals, out=totals)
+    return adjusted
 
 
-__all__ = ["wamecu_probabilities"]
+__all__ = ["wamecu_probabilities", "wamecu_probabilities_batch"]
@@ -1,7 +1,12 @@
 import numpy as np
 import pytest
 
-from wamecu import chi_square_statistic, entropy_gap
+from wamecu import (
+    chi_square_statistic,
+    entropy_gap,
+    outcome_correlation_matrix,
+    rolling_anomaly_scores,
+)
 
 
 def test_chi_square_detects_bias():
@@ -22,3 +27,50 @@ def test_entropy_gap_signals_concentration():
 def test_entropy_gap_validates_inputs():
     with pytest.raises(ValueError):
         entropy_gap(np.array([0.5, 0.5]), np.array([0.4, 0.4]))
+
+
+def test_rolling_anomaly_scores_matches_per_window_diagnostics():
+    rng = np.random.default_rng(3)
+    baseline = np.array([0.1, 0.2, 0.3, 0.4])
+    draws = rng.choice(4, size=200, p=baseline)
+    window = 50
+    scores = rolling_anomaly_scores(
+        draws, baseline, window_size=window, min_expected_count=0
+    )
+    assert list(scores["step"]) == list(range(window - 1, draws.size))
+
+    for row in scores.itertuples():
+        counts = np.bincount(draws[row.step + 1 - window : row.step + 1], minlength=4)
+        stat, p_value = chi_square_statistic(counts, baseline * window)
+        gap = entropy_gap(counts / window, baseline)
+        assert row.chi2_stat == pytest.approx(stat)
+        assert row.chi2_pvalue == pytest.approx(p_value)
+        assert row.entropy_gap == pytest.approx(gap)
+
+
+def test_rolling_anomaly_scores_pools_sparse_outcomes():
+    rng = np.random.default_rng(5)
+    baseline = np.array([0.02, 0.03, 0.45, 0.5])
+    draws = rng.choice(4, size=300, p=baseline)
+    window = 100
+    scores = rolling_anomaly_scores(draws, baseline, window_size=window)
+    assert scores.attrs["pooled_outcomes"] == [0, 1]
+
+    counts = np.bincount(draws[-window:], minlength=4)
+    pooled = np.array([counts[2], counts[3], counts[0] + counts[1]])
+    stat, p_value = chi_square_statistic(pooled, np.array([45.0, 50.0, 5.0]))
+    assert scores["chi2_stat"].iloc[-1] == pytest.approx(stat)
+    assert scores["chi2_pvalue"].iloc[-1] == pytest.approx(p_value)
+    assert scores["entropy_gap"].iloc[-1] == pytest.approx(
+        entropy_gap(counts / window, baseline)
+    )
+
+
+@pytest.mark.parametrize(
+    "draws", [[0, 1, 2, 3, 1, 2, 2, 0, 3, 3], [0, 2, 2, 3, 0, 3, 2, 0]]
+)
+def test_outcome_correlation_matrix_matches_corrcoef(draws):
+    # The second draw set never hits outcome 1 (zero variance).
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = np.nan_to_num(np.corrcoef(np.eye(4)[draws], rowvar=False))
+    assert np.allclose(outcome_correlation_matrix(draws, 4), expected)
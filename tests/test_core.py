@@ -1,7 +1,15 @@
 import numpy as np
 import pytest
 
-from wamecu import BetaDriftConfig, ewma_estimator, beta_drift, wamecu_probabilities
+from wamecu import (
+    AdaptiveBetaEstimator,
+    BetaDriftConfig,
+    beta_drift,
+    ewma_estimator,
+    inverse_mass_probabilities,
+    kalman_tracker,
+    wamecu_probabilities,
+)
 
 
 def test_wamecu_probabilities_properties():
@@ -23,8 +31,77 @@ def test_beta_drift_bounds():
     assert np.all(series >= -0.95 - 1e-9)
 
 
+def test_beta_drift_matches_sequential_recurrence():
+    for walk_scale in (0.002, 0.2):
+        config = BetaDriftConfig(
+            n_steps=300, n_outcomes=5, walk_scale=walk_scale, sin_period=40, seed=3
+        )
+        rng = np.random.default_rng(config.seed)
+        phase = rng.uniform(0, 2 * np.pi)
+        current = np.zeros(config.n_outcomes)
+        expected = np.zeros((config.n_steps, config.n_outcomes))
+        for t in range(config.n_steps):
+            current += rng.normal(0.0, config.walk_scale, size=config.n_outcomes)
+            current -= current.mean()
+            current[0] += config.sin_amplitude * np.sin(
+                2 * np.pi * t / config.sin_period + phase
+            )
+            current = np.clip(current, -config.clip, config.clip)
+            expected[t] = current
+
+        assert np.allclose(beta_drift(config), expected)
+
+
 def test_ewma_estimator_shape():
     draws = [0, 1, 1, 2, 2, 2]
     history = ewma_estimator(draws, n_outcomes=3, alpha=0.2)
     assert history.shape == (len(draws), 3)
     assert np.all(np.isfinite(history))
+
+
+def test_adaptive_estimator_batch_matches_sequential_updates():
+    draws = np.random.default_rng(1).integers(0, 4, size=300)
+    sequential = AdaptiveBetaEstimator(n_outcomes=4, smoothing=0.2)
+    stepwise = np.array([sequential.update(int(draw)) for draw in draws])
+
+    batched = AdaptiveBetaEstimator(n_outcomes=4, smoothing=0.2)
+    history = batched.batch_update(draws)
+    assert np.allclose(history, stepwise)
+    assert np.allclose(batched._probabilities, sequential._probabilities)
+
+
+@pytest.mark.parametrize("initial_beta", [None, [0.3, -0.2, 1.2, -0.1]])
+def test_kalman_tracker_matches_sequential_recurrence(initial_beta):
+    draws = np.random.default_rng(5).integers(0, 4, size=200)
+    process_var, observation_var = 0.005, 0.05
+
+    state = np.zeros(4) if initial_beta is None else np.clip(initial_beta, -0.99, 0.99)
+    covariance = np.full(4, 0.25)
+    expected = np.zeros((draws.size, 4))
+    for t, obs in enumerate(draws):
+        measurement = np.full(4, -0.25)
+        measurement[obs] = 0.75
+        covariance = covariance + process_var
+        gain = covariance / (covariance + observation_var)
+        state = state + gain * (measurement - state)
+        covariance = (1 - gain) * covariance
+        state -= state.mean()
+        state = np.clip(state, -0.99, 0.99)
+        expected[t] = state
+
+    history = kalman_tracker(
+        draws,
+        n_outcomes=4,
+        process_var=process_var,
+        observation_var=observation_var,
+        initial_beta=initial_beta,
+    )
+    assert np.allclose(history, expected)
+
+
+@pytest.mark.parametrize("softness", [1.0, 2.0, 0.5, 3.0])
+def test_inverse_mass_probabilities_matches_power_law(softness):
+    weights = np.array([98.0, 100.0, 101.5, 103.0, 0.5])
+    expected = 1 / np.power(weights, softness)
+    expected /= expected.sum()
+    assert np.allclose(inverse_mass_probabilities(weights, softness), expected)
@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
 
-from wamecu import simulate_draws, wamecu_probabilities
+from wamecu import (
+    simulate_counts,
+    simulate_draws,
+    spawn_generators,
+    stream_draws,
+    wamecu_probabilities,
+    wamecu_probabilities_batch,
+)
 
 
 def test_wamecu_probabilities_normalize():
@@ -21,3 +28,49 @@ def test_simulate_draws_reproducible():
 def test_wamecu_probabilities_mismatch_shape():
     with pytest.raises(ValueError):
         wamecu_probabilities(2, [0.1, 0.2, 0.3])
+
+
+def test_wamecu_probabilities_batch_matches_rows():
+    beta = np.array([[0.1, -0.05, -0.05], [0.3, 0.0, -0.2], [0.0, 0.0, 0.0]])
+    batch = wamecu_probabilities_batch(3, beta)
+    for row, probs in zip(beta, batch):
+        assert np.allclose(probs, wamecu_probabilities(3, row))
+
+    with pytest.raises(ValueError):
+        wamecu_probabilities_batch(3, [[0.5, 0.5, -2.0]])
+
+
+def test_spawn_generators_reproducible_and_independent():
+    first = [
+        simulate_draws([0.2, 0.5, 0.3], 200, seed=rng) for rng in spawn_generators(7, 3)
+    ]
+    second = [
+        simulate_draws([0.2, 0.5, 0.3], 200, seed=rng) for rng in spawn_generators(7, 3)
+    ]
+    for one, two in zip(first, second):
+        assert np.array_equal(one, two)
+    assert not np.array_equal(first[0], first[1])
+
+
+def test_simulate_counts_sum_and_reproducible():
+    probs = np.array([0.2, 0.5, 0.3])
+    counts = simulate_counts(probs, 1000, seed=7)
+    assert counts.shape == (3,)
+    assert counts.sum() == 1000
+    assert np.array_equal(counts, simulate_counts(probs, 1000, seed=7))
+
+
+def test_stream_draws_matches_per_step_choice():
+    beta_series = np.random.default_rng(2).uniform(-0.5, 0.5, size=(500, 5))
+    rng = np.random.default_rng(9)
+    expected = np.array(
+        [rng.choice(5, p=wamecu_probabilities(5, beta)) for beta in beta_series]
+    )
+    assert np.array_equal(stream_draws(beta_series, seed=9), expected)
+
+
+def test_spawn_generators_without_jumped():
+    parent = np.random.Generator(np.random.SFC64(3))
+    children = spawn_generators(parent, 2)
+    assert all(isinstance(child.bit_generator, np.random.SFC64) for child in children)
+    assert children[0].random() != children[1].random()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import numpy as np
 
-from wamecu import estimate_static_effect, simulate_with_static
+from wamecu import estimate_static_effect, simulate_with_static, simulate_with_static_batch
 
 
 def test_simulate_with_static_shape() -> None:
@@ -39,3 +39,20 @@ def test_effect_estimator_runs() -> None:
     result = simulate_with_static(n_outcomes=5, q_scale=2e-9, humidity=30, trials_per_draw=60, seed=123)
     effect = estimate_static_effect(result["q"], result["counts"], trials=int(result["counts"].sum()))
     assert np.isfinite(effect)
+
+
+def test_static_batch_shapes() -> None:
+    result = simulate_with_static_batch(n_outcomes=6, q_scale=[1e-9, 5e-9, 2e-9], humidity=30, trials_per_draw=40, seed=11)
+    for key in ("q", "beta", "probs", "counts"):
+        assert result[key].shape == (3, 6)
+    assert np.allclose(result["probs"].sum(axis=1), 1.0)
+    assert np.all(result["counts"].sum(axis=1) == 40)
+    assert np.all(np.abs(result["beta"]) <= 0.95)
+
+
+def test_static_batch_rows_follow_their_configuration() -> None:
+    q_scale = np.array([1e-9, 4e-9, 2e-9])
+    humidity = np.array([10.0, 50.0, 90.0])
+    result = simulate_with_static_batch(n_outcomes=2000, q_scale=q_scale, humidity=humidity, trials_per_draw=10, seed=3)
+    expected_spread = q_scale * np.clip(1.0 - humidity / 100.0, 0.1, 1.0)
+    assert np.allclose(result["q"].std(axis=1), expected_spread, rtol=0.1)